@@ -14,7 +14,7 @@ from glad.generator.util import (
     is_device_command,
     strip_specification_prefix,
     collect_alias_information,
-    find_extensions_with_aliases,
+    select_with_aliases,
     jinja2_contextfunction,
     jinja2_contextfilter
 )
@@ -30,27 +30,29 @@ DebugReturn = namedtuple('_DebugReturn', ['declaration', 'assignment', 'ret'])
 Header = namedtuple('_Header', ['name', 'include', 'url'])
 
 
+# type_to_c is called for every parameter of every command from the templates,
+# cache the result on the parsed type (see memoize `method`)
+@glad.util.memoize(method=True)
 def type_to_c(parsed_type):
-    result = ''
+    name = parsed_type.name
 
-    for text in glad.util.itertext(parsed_type._element, ignore=('comment',)):
-        if text == parsed_type.name:
-            # yup * is sometimes part of the name
-            result += '*' * text.count('*')
-        else:
-            result += text
+    result = ''.join([
+        # yup * is sometimes part of the name
+        '*' * text.count('*') if text == name else text
+        for text in glad.util.itertext(parsed_type._element, ignore=('comment',))
+    ])
     result = _ARRAY_RE.sub('*', result)
     return result.strip()
 
 
 def params_to_c(params):
-    result = ', '.join(param.type._raw for param in params) if params else 'void'
+    result = ', '.join([param.type._raw for param in params]) if params else 'void'
     result = ' '.join(result.split())
     return result
 
 
 def param_names(params):
-    return ', '.join(param.name for param in params)
+    return ', '.join([param.name for param in params])
 
 
 @jinja2_contextfunction
@@ -79,27 +81,28 @@ def is_void(t):
     return type_to_c(t).lower() == 'void'
 
 
+@glad.util.memoize(method=True)
 def get_debug_impl(command, command_code_name=None):
     command_code_name = command_code_name or command.name
 
     impl = params_to_c(command.params)
     func = param_names(command.params)
 
-    pre_callback = ', '.join(filter(None, [
-        '"{}"'.format(command.name),
-        '(GLADapiproc) {}'.format(command_code_name),
-        str(len(command.params)),
-        func
-    ]))
+    pre_callback = '"{}", (GLADapiproc) {}, {}'.format(command.name, command_code_name, len(command.params))
+    # only the parameter list can be empty
+    if func:
+        pre_callback += ', ' + func
 
-    is_void_ret = is_void(command.proto.ret)
+    ret_type = type_to_c(command.proto.ret)
+    # lower because of win API having VOID
+    is_void_ret = ret_type.lower() == 'void'
 
     post_callback = ('NULL, ' if is_void_ret else '(void*) &ret, ') + pre_callback
 
     ret = DebugReturn('', '', '')
     if not is_void_ret:
         ret = DebugReturn(
-            '{} ret;\n    '.format(type_to_c(command.proto.ret)),
+            '{} ret;\n    '.format(ret_type),
             'ret = ',
             'return ret;'
         )
@@ -109,26 +112,28 @@ def get_debug_impl(command, command_code_name=None):
 
 @jinja2_contextfilter
 def ctx(jinja_context, name, context='context', raw=False, name_only=False, member=False):
-    options = jinja_context['options']
+    if jinja_context['options']['mx']:
+        return _mx_ctx(jinja_context['spec'].name, name, context, raw, member)
+
+    # you won't the name, only when we're not mx
+    if member or name_only:
+        return name
+
+    return 'glad_' + name
 
-    prefix = 'glad_'
-    if options['mx']:
-        prefix = context + '->'
-        if name.startswith('GLAD_'):
-            name = name[5:]
 
-        if not raw:
-            name = strip_specification_prefix(name, jinja_context['spec'])
+def _mx_ctx(spec_name, name, context, raw, member):
+    if name.startswith('GLAD_'):
+        name = name[5:]
+
+    if not raw:
+        name = strip_specification_prefix(name, spec_name)
 
     # it's a mx struct member
     if member:
         return name
 
-    # you won't the name, only when we're not mx
-    if name_only and not options['mx']:
-        return name
-
-    return prefix + name
+    return context + '->' + name
 
 
 @jinja2_contextfilter
@@ -203,6 +208,14 @@ def replace_cpp_style_comments(inp):
     return _CPP_STYLE_COMMENT_RE.sub(r'\1/*\2 */', inp)
 
 
+_TEMPLATE_GLOBALS = dict(
+    get_debug_impl=get_debug_impl,
+    loadable=loadable,
+    enum_member=enum_member,
+    chain=itertools.chain
+)
+
+
 class CConfig(Config):
     DEBUG = ConfigOption(
         converter=bool,
@@ -307,12 +320,7 @@ class CGenerator(JinjaGenerator):
 
         self._headers = dict()
 
-        self.environment.globals.update(
-            get_debug_impl=get_debug_impl,
-            loadable=loadable,
-            enum_member=enum_member,
-            chain=itertools.chain
-        )
+        self.environment.globals.update(_TEMPLATE_GLOBALS)
 
         self.environment.filters.update(
             defined=lambda x: 'defined({})'.format(x),
@@ -346,7 +354,12 @@ class CGenerator(JinjaGenerator):
                 extensions.update(('WGL_ARB_extensions_string', 'WGL_EXT_extensions_string'))
 
             if config['ALIAS']:
-                extensions.update(find_extensions_with_aliases(spec, api, version, profile, extensions))
+                return select_with_aliases(
+                    lambda extensions, sink: JinjaGenerator.select(
+                        self, spec, api, version, profile, extensions, config, sink=sink
+                    ),
+                    spec, api, version, profile, extensions, sink
+                )
 
         return JinjaGenerator.select(self, spec, api, version, profile, extensions, config, sink=sink)
 
@@ -405,10 +418,11 @@ class CGenerator(JinjaGenerator):
         > The same problem happens with glad.h as well.
         > The workaround appears to be to use long instead of ptrdiff_t.
         """
-        for type_name in  ('GLsizeiptr', 'GLintptr', 'GLsizeiptrARB', 'GLintptrARB'):
-            if type_name in feature_set.types:
-                index = feature_set.types.index(type_name)
-                type_ = copy.deepcopy(feature_set.types[index])
+        type_names = ('GLsizeiptr', 'GLintptr', 'GLsizeiptrARB', 'GLintptrARB')
+
+        for index, type_ in enumerate(feature_set.types):
+            if type_.name in type_names:
+                type_ = copy.deepcopy(type_)
                 type_._raw = \
                     '#if defined(__ENVIRONMENT_MAC_OS_X_VERSION_MIN_REQUIRED__) ' + \
                     '&& (__ENVIRONMENT_MAC_OS_X_VERSION_MIN_REQUIRED__ > 1060)\n' + \
@@ -6,7 +6,7 @@ from glad.generator import JinjaGenerator
 from glad.generator.util import (
     strip_specification_prefix,
     collect_alias_information,
-    find_extensions_with_aliases,
+    select_with_aliases,
     jinja2_contextfilter
 )
 from glad.parse import ParsedType, EnumType
@@ -204,7 +204,12 @@ class RustGenerator(JinjaGenerator):
             extensions = set(extensions)
 
             if config['ALIAS']:
-                extensions.update(find_extensions_with_aliases(spec, api, version, profile, extensions))
+                return select_with_aliases(
+                    lambda extensions, sink: JinjaGenerator.select(
+                        self, spec, api, version, profile, extensions, config, sink=sink
+                    ),
+                    spec, api, version, profile, extensions, sink
+                )
 
         return JinjaGenerator.select(self, spec, api, version, profile, extensions, config, sink=sink)
 
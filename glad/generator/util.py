@@ -1,7 +1,10 @@
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
 import jinja2
+import operator
 import re
 
+from glad.sink import CollectingSink
+
 if hasattr(jinja2, 'pass_context'):
     jinja2_contextfunction = jinja2.pass_context
     jinja2_contextfilter = jinja2.pass_context
@@ -39,9 +42,11 @@ def strip_specification_prefix(name, spec_name=None):
     :return: stripped name
     """
     api_prefix = getattr(spec_name, 'name', spec_name)
+    prefix_length = len(api_prefix)
 
-    if name.lower().startswith(api_prefix):
-        name = name[len(api_prefix):].lstrip('_')
+    # only lower the part of the name which is compared to the prefix
+    if name[:prefix_length].lower() == api_prefix:
+        name = name[prefix_length:].lstrip('_')
 
     # 3DFX_tbuffer -> _3DFX_tbuffer
     if not name[0].isalpha():
@@ -54,40 +59,52 @@ def collect_alias_information(commands):
     # Thanks @derhass
     # https://github.com/derhass/glad/commit/9302dc566c695aebece901809f170297627950c9#diff-25f472d6fbc5268fe9a449252923b693
 
-    # keep a dictionary, store the set of aliases known for each function
-    # initialize it to identity, each function aliases itself
-    alias = dict((command.name, set([command.name])) for command in commands)
-    # now, add all further aliases
+    # union-find over all command names, initially every function
+    # is in its own set and only aliases itself
+    parent = dict((command.name, command.name) for command in commands)
+    rank = dict((command.name, 0) for command in commands)
+
+    def find(name):
+        # path halving, every visited name is pointed to its grandparent
+        while parent[name] != name:
+            parent[name] = parent[parent[name]]
+            name = parent[name]
+        return name
+
+    def union(a, b):
+        a, b = find(a), find(b)
+        if a == b:
+            return
+        if rank[a] < rank[b]:
+            a, b = b, a
+        parent[b] = a
+        if rank[a] == rank[b]:
+            rank[a] += 1
+
     for command in commands:
-        if command.alias is not None:
-            # aliases is the set of all aliases known for this function
-            aliases = alias[command.name]
-            aliases.add(command.alias)
-            # unify all alias sets of all aliased functions
-            new_aliases = set()
-            missing_funcs = set()
-            for aliased_func in aliases:
-                try:
-                    new_aliases.update(alias[aliased_func])
-                except KeyError:
-                    missing_funcs.add(aliased_func)
-            # remove all missing functions
-            new_aliases = new_aliases - missing_funcs
-            # add the alias set to all aliased functions
-            for aliased_command in new_aliases:
-                alias[aliased_command] = new_aliases
-    # remove self-aliases and (then) empty entries
+        # aliases to functions which are not part of the feature set are ignored
+        if command.alias is not None and command.alias in parent:
+            union(command.name, command.alias)
+
+    # materialize the alias sets, one per root
+    members = defaultdict(list)
+    for name in parent:
+        members[find(name)].append(name)
+
+    # every member of an alias set shares the same sorted tuple
+    alias_sets = dict((root, tuple(sorted(names))) for root, names in members.items())
+
+    result = OrderedDict()
     for command in commands:
-        if len(alias[command.name]) == 1:
-            del alias[command.name]
+        aliases = alias_sets[find(command.name)]
+        # drop self-aliases
+        if len(aliases) > 1:
+            result[command.name] = aliases
 
-    return OrderedDict(
-        (command.name, sorted(alias[command.name]))
-        for command in commands if command.name in alias
-    )
+    return result
 
 
-def find_extensions_with_aliases(spec, api, version, profile, extensions):
+def find_extensions_with_aliases(spec, api, version, profile, extensions, feature_set=None):
     """
     Finds all extensions that contain a command that is an alias
     to a command in the current feature set (api, version, profile, extensions).
@@ -101,27 +118,62 @@ def find_extensions_with_aliases(spec, api, version, profile, extensions):
     :param version: the requested version
     :param profile: the requested profile
     :param extensions: the base extension list
+    :param feature_set: the already selected feature set for the above arguments,
+                        if missing it will be selected from the specification
     :return: all extensions that contain an alias to the desired feature set
     """
-    feature_set = spec.select(api, version, profile, extensions)
+    if feature_set is None:
+        feature_set = spec.select(api, version, profile, extensions)
 
-    command_names = set(command.name for command in feature_set.commands)
+    get_name = operator.attrgetter('name')
+    command_names = set(map(get_name, feature_set.commands))
+    selected_extensions = set(map(get_name, feature_set.extensions))
 
     new_extensions = set()
     for extension in spec.extensions[api].values():
-        if extension in feature_set.extensions:
+        if extension.name in selected_extensions:
             continue
 
         for command in extension.get_requirements(spec, api, profile).commands:
             # find all extensions which have an alias to a selected function
-            if command.alias and command.alias in command_names:
-                new_extensions.add(extension.name)
-                break
-
-            # find all extensions that have a function with the same name
-            if command.name in command_names:
+            # or a function with the same name
+            if command.name in command_names or command.alias in command_names:
                 new_extensions.add(extension.name)
                 break
 
     return new_extensions
 
+
+def select_with_aliases(select, spec, api, version, profile, extensions, sink):
+    """
+    Selects a feature set with all extensions added that contain
+    an alias to a command of the requested feature set,
+    see `find_extensions_with_aliases`.
+
+    The feature set is only selected a second time if there
+    actually are extensions to add. Messages of a selection
+    that is not returned do not reach the sink.
+
+    :param select: callable taking the extensions and a sink, selecting the feature set
+    :param spec: the specification
+    :param api: the requested api
+    :param version: the requested version
+    :param profile: the requested profile
+    :param extensions: the base extension list
+    :param sink: sink used to collect non fatal errors and information
+    :return: the selected feature set
+    """
+    probe_sink = CollectingSink()
+    feature_set = select(extensions, probe_sink)
+
+    alias_extensions = find_extensions_with_aliases(
+        spec, api, version, profile, extensions, feature_set=feature_set
+    )
+    if alias_extensions:
+        return select(set(extensions).union(alias_extensions), sink)
+
+    # nothing to add, the probe is the result, forward its messages
+    for message in probe_sink.messages:
+        getattr(sink, message.type)(message.content, exc=message.exc)
+
+    return feature_set